@@ -32,30 +32,39 @@ from dotenv import load_dotenv
 from agenteconomy.center.model import *
 from agenteconomy.utils import safe_call
 from agenteconomy.utils.logger import get_logger
-from agenteconomy.utils.product_attribute_loader import inject_product_attributes
+from agenteconomy.utils.product_attribute_loader import inject_product_attributes, set_attribute_map
 
 # Initialize environment and logger
 load_dotenv()
 
 
+# CPUs reserved by the EconomicCenter actor
+ECONOMIC_CENTER_NUM_CPUS = 8
+
+
 # =============================================================================
 # Economic Center Class
 # =============================================================================
 
-@ray.remote(num_cpus=8)
+@ray.remote(num_cpus=ECONOMIC_CENTER_NUM_CPUS)
 class EconomicCenter:
 
     # =========================================================================
     # Initialization
     # =========================================================================
-    def __init__(self, tax_policy: TaxPolicy = None, category_profit_margins: Dict[str, float] = None):
+    def __init__(self, tax_policy: TaxPolicy = None, category_profit_margins: Dict[str, float] = None,
+                 attribute_map: Dict[str, Dict[str, Any]] = None):
         """
         Initialize EconomicCenter with tax rates
         
         Args:
             tax_policy: 税收政策配置（包含累进税阶梯）
             category_profit_margins: 各行业毛利率配置
+            attribute_map: 由driver预加载的商品属性表（避免每个actor重复解析JSON）
         """
+        if attribute_map is not None:
+            set_attribute_map(attribute_map)
+
         # 税率配置 - 如果未提供，使用默认值
         if tax_policy is None:
             tax_policy = TaxPolicy()  # 使用默认配置
@@ -2428,22 +2437,22 @@ class EconomicCenter:
             if supply_demand_ratio < 0.5:
                 # 库存不足销量的一半 - 严重供不应求
                 base_adjustment += 0.25  # 大幅涨价25%
-                logger.debug(f"🔥 严重供不应求: 库存{current_inventory:.1f} / 销量{quantity_sold:.1f} = {supply_demand_ratio:.2f}")
+                logger.debug("🔥 严重供不应求: 库存%.1f / 销量%.1f = %.2f", current_inventory, quantity_sold, supply_demand_ratio)
             elif supply_demand_ratio < 1.0:
                 # 库存不足一个周期的销量 - 供不应求
                 base_adjustment += 0.15  # 涨价15%
-                logger.debug(f"📈 供不应求: 库存{current_inventory:.1f} / 销量{quantity_sold:.1f} = {supply_demand_ratio:.2f}")
+                logger.debug("📈 供不应求: 库存%.1f / 销量%.1f = %.2f", current_inventory, quantity_sold, supply_demand_ratio)
             elif supply_demand_ratio < 2.0:
                 # 库存略高于销量 - 供需平衡
                 base_adjustment += 0.02  # 小幅涨价2%
             elif supply_demand_ratio < 5.0:
                 # 库存明显高于销量 - 供过于求
                 base_adjustment -= 0.08  # 降价8%
-                logger.debug(f"📉 供过于求: 库存{current_inventory:.1f} / 销量{quantity_sold:.1f} = {supply_demand_ratio:.2f}")
+                logger.debug("📉 供过于求: 库存%.1f / 销量%.1f = %.2f", current_inventory, quantity_sold, supply_demand_ratio)
             else:
                 # 库存严重过剩 - 严重供过于求
                 base_adjustment -= 0.15  # 大幅降价15%
-                logger.debug(f"⚠️ 严重供过于求: 库存{current_inventory:.1f} / 销量{quantity_sold:.1f} = {supply_demand_ratio:.2f}")
+                logger.debug("⚠️ 严重供过于求: 库存%.1f / 销量%.1f = %.2f", current_inventory, quantity_sold, supply_demand_ratio)
         
         # 4. 根据收入效率调整
         if revenue > 0 and quantity_sold > 0:
@@ -3655,7 +3664,7 @@ Do NOT output any explanation, just the number.
                 monthly_profit, profit_margin, policy_signal, sales_trend
             )
 
-            logger.debug(f"📊 企业 {firm.company_id} 规则决策: 研发比例={research_share:.1%}")
+            logger.debug("📊 企业 %s 规则决策: 研发比例=%.1f%%", firm.company_id, research_share * 100)
 
             research_share = max(0.0, min(max_research_share, research_share))
             return research_share
@@ -3759,7 +3768,7 @@ Do NOT output any explanation, just the number.
                     "abilities_count": len(employee_abilities)
                 })
                 
-                logger.debug(f"员工 {employee.get('household_id')}_{employee.get('lh_type')} ({job_soc}) 技能匹配度: {match_score:.3f}")
+                logger.debug("员工 %s_%s (%s) 技能匹配度: %.3f", employee.get('household_id'), employee.get('lh_type'), job_soc, match_score)
             
             # 计算平均匹配分数和有效劳动力
             avg_match_score = total_match_score / len(employees)
@@ -3890,14 +3899,14 @@ Do NOT output any explanation, just the number.
                 job_skills = job_info.get('skills', {})
                 job_abilities = job_info.get('abilities', {})
                 
-                logger.debug(f"找到SOC {soc_code}的工作要求: {job_info.get('Title', 'Unknown')}")
+                logger.debug("找到SOC %s的工作要求: %s", soc_code, job_info.get('Title', 'Unknown'))
                 
                 return {
                     "skills": job_skills if isinstance(job_skills, dict) else {},
                     "abilities": job_abilities if isinstance(job_abilities, dict) else {}
                 }
             else:
-                logger.debug(f"未找到SOC {soc_code}的工作要求，使用默认要求")
+                logger.debug("未找到SOC %s的工作要求，使用默认要求", soc_code)
                 
         except Exception as e:
             logger.error(f"获取SOC {soc_code}工作要求失败: {e}")
@@ -4405,7 +4414,7 @@ Do NOT output any explanation, just the number.
                     priority_score = 1.0
                 
                 product_priorities[product_id] = priority_score
-                logger.debug(f"劳动力生产: {product.name} (无销售记录, 库存{product.amount:.1f}, 优先级{priority_score})")
+                logger.debug("劳动力生产: %s (无销售记录, 库存%.1f, 优先级%s)", product.name, product.amount, priority_score)
         
         # 若有家庭购买记录，则按家庭销量占比分配；
         # 否则回退到基于销量/库存的优先级逻辑。
@@ -4435,7 +4444,7 @@ Do NOT output any explanation, just the number.
                     else:
                         priority_score = 1.0
                     product_priorities[product_id] = priority_score
-                    logger.debug(f"劳动力生产: {product.name} (无销售记录, 库存{product.amount:.1f}, 优先级{priority_score})")
+                    logger.debug("劳动力生产: %s (无销售记录, 库存%.1f, 优先级%s)", product.name, product.amount, priority_score)
         
         # 按优先级分配产出
         total_priority = sum(product_priorities.values())
@@ -4468,7 +4477,7 @@ Do NOT output any explanation, just the number.
                 actual_output += product_output
                 actual_output_value += product_value
                 
-                logger.debug(f"劳动力产出: {product.name} 优先级 {priority:.2f}, 增加 {product_output:.2f}")
+                logger.debug("劳动力产出: %s 优先级 %.2f, 增加 %.2f", product.name, priority, product_output)
         else:
             # 这种情况理论上不应该发生，因为所有产品都会有优先级
             logger.warning(f"公司 {company_id} 没有产品可以分配劳动力产出")
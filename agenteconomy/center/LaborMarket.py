@@ -23,7 +23,7 @@ class LaborMarket:
             job: Job object to be posted
         """
         self.job_openings.append(job)
-        self.logger.info(f"Job {job.job_id} posted")
+        self.logger.info("Job %s posted", job.job_id)
     
     def query_opening_jobs(self) -> List[Job]:
         return [job for job in self.job_openings if job.is_valid]
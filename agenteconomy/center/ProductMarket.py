@@ -5,13 +5,18 @@ import ray
 from agenteconomy.center.Model import *
 from agenteconomy.utils.logger import get_logger
 from agenteconomy.utils.embedding import embedding
-from agenteconomy.utils.product_attribute_loader import get_product_attributes
+from agenteconomy.utils.product_attribute_loader import get_product_attributes, set_attribute_map
 import os
 
+# CPUs reserved by the ProductMarket actor
+PRODUCT_MARKET_NUM_CPUS = 32
 
-@ray.remote(num_cpus=32)
+
+@ray.remote(num_cpus=PRODUCT_MARKET_NUM_CPUS)
 class ProductMarket:
-    def __init__(self):
+    def __init__(self, attribute_map: Optional[Dict[str, Dict[str, Any]]] = None):
+        if attribute_map is not None:
+            set_attribute_map(attribute_map)
         self.products: List[Product] = []
         self.client = []
         self.purchase_records: Dict[str, List[PurchaseRecord]] = {}
@@ -20,7 +25,7 @@ class ProductMarket:
 
     def add_product(self, product: Product):
         self.products.append(product)
-        self.logger.info(f"Product {product.product_id} added to the market")
+        self.logger.info("Product %s added to the market", product.product_id)
 
     def publish_product(self, product: Product):
 
@@ -70,9 +75,9 @@ class ProductMarket:
             return candidates[:top_k]
 
         search_limit = top_k * 3
-        query_embedding = embedding(query)
         if not getattr(self, "client", None):
             return _fallback_from_published()
+        query_embedding = embedding(query)
 
         hits = self.client.search(
             collection_name=self.collection_name,
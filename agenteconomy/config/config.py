@@ -1,8 +1,12 @@
 from dataclasses import dataclass
+from typing import Optional
 from agenteconomy.utils.logger import get_logger
 logger = get_logger(name="simulation_config")
 @dataclass
 class SimulationConfig:
     num_months: int = 12
     num_households: int = 100
-    
\ No newline at end of file
+    # Ray cluster sizing; None lets Ray detect the machine's CPUs/GPUs
+    ray_cpus: Optional[int] = None
+    ray_gpus: Optional[int] = None
+    
@@ -1,10 +1,12 @@
 from agenteconomy.agent.household import *
 from agenteconomy.utils.logger import get_logger
 from agenteconomy.center.LaborMarket import LaborMarket
+from agenteconomy.config.config import SimulationConfig
 logger = get_logger(name="main")
 import ray
 if __name__ == "__main__":
-    ray.init(num_cpus=128, num_gpus=2)
+    config = SimulationConfig()
+    ray.init(num_cpus=config.ray_cpus, num_gpus=config.ray_gpus, ignore_reinit_error=True)
     logger.info(f"Simulation started")
     labor_market = LaborMarket.remote()
-    logger.info(f"Simulation ended")
\ No newline at end of file
+    logger.info(f"Simulation ended")
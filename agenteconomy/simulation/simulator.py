@@ -4,15 +4,17 @@ from agenteconomy.utils.logger import get_logger
 logger = get_logger(name="simulator")
 from agenteconomy.center.Model import *
 from agenteconomy.config.config import SimulationConfig
-from agenteconomy.center.Ecocenter import EconomicCenter
+from agenteconomy.center.Ecocenter import EconomicCenter, ECONOMIC_CENTER_NUM_CPUS
 from agenteconomy.center.LaborMarket import LaborMarket
-from agenteconomy.center.ProductMarket import ProductMarket
+from agenteconomy.center.ProductMarket import ProductMarket, PRODUCT_MARKET_NUM_CPUS
 from agenteconomy.agent.firm import Firm
 from agenteconomy.agent.household import Household
 from agenteconomy.agent.government import Government
 from agenteconomy.agent.bank import Bank
+from agenteconomy.utils.product_attribute_loader import load_attribute_map
 from datetime import datetime
 import asyncio
+import ray
 
 class Simulator:
     def __init__(self, config:SimulationConfig):
@@ -43,6 +45,7 @@ class Simulator:
         logger.info("开始设置仿真环境...")
         
         try:
+            # 税收政策只构建一次，经济中心与政府共用同一份
             if self.config.enable_progressive_tax_system:
                 # 初始化政府（从config创建TaxPolicy）
                 tax_policy = TaxPolicy(
@@ -50,12 +53,25 @@ class Simulator:
                     corporate_tax_rate=self.config.corporate_tax_rate,
                     vat_rate=self.config.vat_rate
                 )
+            else:
+                tax_policy = TaxPolicy()
+            # 集群CPU不足以容纳经济中心与商品市场actor时直接失败，避免actor一直pending
+            reserved_cpus = PRODUCT_MARKET_NUM_CPUS + ECONOMIC_CENTER_NUM_CPUS
+            available_cpus = ray.cluster_resources().get("CPU", 0)
+            if available_cpus < reserved_cpus:
+                logger.error(f"Ray集群CPU不足: 可用 {available_cpus:g}，ProductMarket与EconomicCenter需要 {reserved_cpus}；请将 SimulationConfig.ray_cpus 设为至少 {reserved_cpus}")
+                return False
+
+            # 商品属性表只在driver解析一次，放入对象存储后共享给各actor
+            attribute_map_ref = ray.put(load_attribute_map())
+
             # 初始化核心组件（传入税率配置）
             self.economic_center = EconomicCenter.remote(
                 tax_policy=tax_policy,
-                category_profit_margins=self.config.category_profit_margins
+                category_profit_margins=self.config.category_profit_margins,
+                attribute_map=attribute_map_ref
             )
-            self.product_market = ProductMarket.remote()
+            self.product_market = ProductMarket.remote(attribute_map=attribute_map_ref)
             self.labor_market = LaborMarket.remote()
             
             self.government = Government.remote(
@@ -65,16 +81,19 @@ class Simulator:
                     economic_center=self.economic_center
                 )
 
-            await self.government.initialize.remote()
-            
             # 初始化银行
             self.bank = Bank.remote(
                 bank_id="bank_main_simulation",
                 initial_capital=1000000.0,
                 economic_center=self.economic_center
             )
-            await self.bank.initialize.remote()
-            logger.info("银行系统初始化完成")
+
+            # actor 句柄创建后即可使用，政府与银行的注册并发执行
+            await asyncio.gather(
+                self.government.initialize.remote(),
+                self.bank.initialize.remote()
+            )
+            logger.info("政府与银行系统初始化完成")
             
             # 加载数据
             logger.info("加载仿真数据...")
@@ -1,4 +1,6 @@
 from transformers import AutoTokenizer, AutoModel
+from functools import lru_cache
+from typing import List
 import torch
 import torch.nn.functional as F
 import numpy as np
@@ -6,9 +8,18 @@ import os
 
 
 device = "cuda" if torch.cuda.is_available() else "cpu"
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+# Half precision on GPU; the CPU path stays in FP32
+dtype = torch.float16 if device == "cuda" else torch.float32
+# Matches max_seq_length in the model's sentence_bert_config.json
+MAX_SEQ_LENGTH = 256
 
-tokenizer = AutoTokenizer.from_pretrained(os.getenv("MODEL_PATH"))
-model = AutoModel.from_pretrained(os.getenv("MODEL_PATH"))
+@lru_cache(maxsize=1)
+def _load_model():
+    """Load the tokenizer and model on first use instead of at import time."""
+    tokenizer = AutoTokenizer.from_pretrained(os.getenv("MODEL_PATH"), use_fast=True)
+    model = AutoModel.from_pretrained(os.getenv("MODEL_PATH"), dtype=dtype).to(device).eval()
+    return tokenizer, model
 
 def embedding(text: str) -> np.ndarray:
     """
@@ -20,18 +31,46 @@ def embedding(text: str) -> np.ndarray:
     Returns:
         np.ndarray: The normalized embedding vector.
     """
-    inputs = tokenizer(text, return_tensors='pt', truncation=True, padding=True)
-    inputs = {k: v.to(device) for k, v in inputs.items()}
-    with torch.no_grad():
-        outputs = model(**inputs)
-    
-    # Mean pooling
-    pooled_output = mean_pooling(outputs, inputs['attention_mask']).squeeze(0)
+    return _embed_str(text).tolist()
+
+@lru_cache(maxsize=100_000)
+def _embed_str(text: str) -> np.ndarray:
+    """Memoize embeddings of repeated texts as compact read-only float32 arrays."""
+    vector = np.asarray(embedding_batch([text])[0], dtype=np.float32)
+    vector.setflags(write=False)
+    return vector
 
-    # Normalize the output
-    normalized_embedding = F.normalize(pooled_output, p=2, dim=0)
+def embedding_batch(texts: List[str]) -> List[List[float]]:
+    """
+    Generate embeddings for many texts with one tokenizer call and one forward pass per batch.
+    
+    Args:
+        texts (List[str]): The input texts to be embedded.
     
-    return normalized_embedding.cpu().numpy().tolist()
+    Returns:
+        List[List[float]]: One normalized embedding vector per input text, in input order.
+    """
+    tokenizer, model = _load_model()
+    results = []
+    for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+        batch = texts[start:start + EMBEDDING_BATCH_SIZE]
+        inputs = tokenizer(batch, return_tensors='pt', truncation=True, max_length=MAX_SEQ_LENGTH, padding='longest')
+        inputs = {k: v.to(device) for k, v in inputs.items()}
+        with torch.inference_mode(), torch.autocast(device_type=device, dtype=dtype, enabled=device == "cuda"):
+            outputs = model(**inputs)
+
+        # Mean pooling
+        pooled_output = mean_pooling(outputs, inputs['attention_mask'])
+
+        # Normalize each row in FP32
+        if device == "cpu":
+            pooled = pooled_output.numpy()
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            results.extend((pooled / np.maximum(norms, 1e-12)).tolist())
+        else:
+            normalized_embeddings = F.normalize(pooled_output.float(), p=2, dim=1)
+            results.extend(normalized_embeddings.cpu().numpy().tolist())
+    return results
 
 # mean pooling
 def mean_pooling(model_output, attention_mask):
@@ -1,20 +1,46 @@
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# Set AGENTECONOMY_SYNC_LOGGING=1 to write straight to stdout (e.g. in unit tests)
+SYNC_LOGGING = os.getenv("AGENTECONOMY_SYNC_LOGGING", "0") == "1"
+
+_log_queue = None
+
+def _get_log_queue():
+    """Start one background listener per process that writes queued records to stdout."""
+    global _log_queue
+    if _log_queue is None:
+        _log_queue = queue.Queue(-1)
+        listener = QueueListener(_log_queue, _make_stream_handler())
+        listener.start()
+        atexit.register(listener.stop)
+    return _log_queue
+
+def _make_stream_handler():
+    handler = logging.StreamHandler(sys.stdout)
+
+    formatter = logging.Formatter(
+        '%(asctime)s | PID:%(process)d | %(name)s | %(message)s',
+        datefmt='%H:%M:%S'
+    )
+    handler.setFormatter(formatter)
+    return handler
 
 def get_logger(name, level=logging.INFO):
     logger = logging.getLogger(name)
     if not logger.handlers:
-        logger.setLevel(level)      
-
-        handler = logging.StreamHandler(sys.stdout)
+        logger.setLevel(level)
 
-        formatter = logging.Formatter(
-            '%(asctime)s | PID:%(process)d | %(name)s | %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        handler.setFormatter(formatter)
+        if SYNC_LOGGING:
+            handler = _make_stream_handler()
+        else:
+            handler = QueueHandler(_get_log_queue())
         logger.addHandler(handler)
-        
+
         logger.propagate = False
-        
-    return logger
\ No newline at end of file
+
+    return logger
@@ -1,4 +1,6 @@
-@dataclass
+from dataclasses import dataclass
+
+@dataclass(slots=True)
 class SystemMetrics:
     """系统指标类"""
     timestamp: float
@@ -10,6 +10,9 @@ logger = get_logger(name="product_attribute_loader")
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 DEFAULT_CONFIG_PATH = os.path.join(ROOT_DIR, "consumer_modeling", "family_attribute_config.json")
 
+# Attribute map handed in by the driver (via ray.put), so actors skip re-parsing the JSON
+_shared_attribute_map: Optional[Dict[str, Dict[str, Any]]] = None
+
 
 @lru_cache(maxsize=1)
 def _load_attribute_map(config_path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
@@ -43,11 +46,25 @@ def _load_attribute_map(config_path: Optional[str] = None) -> Dict[str, Dict[str
     return {}
 
 
+def load_attribute_map(config_path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Return the product attribute map, parsing it once per process."""
+    return _load_attribute_map(config_path)
+
+
+def set_attribute_map(attr_map: Optional[Dict[str, Dict[str, Any]]]) -> None:
+    """Install an attribute map loaded elsewhere; used by actors that receive it from the driver."""
+    global _shared_attribute_map
+    _shared_attribute_map = attr_map
+
+
 def get_product_attributes(product_id: Optional[str], config_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Return attribute payload for a product if available."""
     if not product_id:
         return None
-    attr_map = _load_attribute_map(config_path)
+    if _shared_attribute_map is not None and config_path is None:
+        attr_map = _shared_attribute_map
+    else:
+        attr_map = _load_attribute_map(config_path)
     return attr_map.get(product_id)
 
 